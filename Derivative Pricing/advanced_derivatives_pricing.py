@@ -1,244 +1,426 @@
-import numpy as np
-from scipy.stats import norm
-from typing import Literal, Dict
-
-class AdvancedDerivativesPricing:
-    """
-    A class for pricing various derivative instruments including barrier options, futures, and CFDs.
-
-    This class implements advanced pricing models for financial derivatives, with a focus on
-    barrier options. It also provides methods for calculating option Greeks, futures prices,
-    and CFD (Contract for Difference) prices.
-    """
-
-    def __init__(self, S: float, K: float, T: float, r: float, sigma: float):
-        """
-        Initialize the AdvancedDerivativesPricing object with market parameters.
-
-        Args:
-            S (float): Current price of the underlying asset.
-            K (float): Strike price of the option.
-            T (float): Time to maturity in years.
-            r (float): Risk-free interest rate (annualized).
-            sigma (float): Volatility of the underlying asset (annualized).
-        """
-        self.S = S
-        self.K = K
-        self.T = T
-        self.r = r
-        self.sigma = sigma
-
-    def _d1(self, S: float, K: float, T: float, r: float, sigma: float) -> float:
-        """
-        Calculate the d1 parameter used in the Black-Scholes formula.
-
-        Args:
-            S (float): Current price of the underlying asset.
-            K (float): Strike price of the option.
-            T (float): Time to maturity in years.
-            r (float): Risk-free interest rate (annualized).
-            sigma (float): Volatility of the underlying asset (annualized).
-
-        Returns:
-            float: The calculated d1 value.
-        """
-        return (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-
-    def _d2(self, d1: float, sigma: float, T: float) -> float:
-        """
-        Calculate the d2 parameter used in the Black-Scholes formula.
-
-        Args:
-            d1 (float): The d1 parameter.
-            sigma (float): Volatility of the underlying asset (annualized).
-            T (float): Time to maturity in years.
-
-        Returns:
-            float: The calculated d2 value.
-        """
-        return d1 - sigma * np.sqrt(T)
-
-    def price_barrier_option(self, option_type: Literal['call', 'put'], 
-                             barrier_type: Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out'], 
-                             barrier: float) -> float:
-        """
-        Price a barrier option using the analytical formula.
-
-        This method implements the pricing model for various types of barrier options,
-        including up-and-in, up-and-out, down-and-in, and down-and-out for both call and put options.
-
-        Args:
-            option_type (Literal['call', 'put']): The type of option.
-            barrier_type (Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out']): The type of barrier.
-            barrier (float): The barrier price level.
-
-        Returns:
-            float: The calculated price of the barrier option.
-
-        Raises:
-            ValueError: If any of the required parameters are None or if an invalid option type is provided.
-        """
-        if None in (self.S, self.K, self.T, self.r, self.sigma, barrier):
-            raise ValueError("All parameters must be non-None")
-        
-        # Calculate Black-Scholes parameters
-        d1 = self._d1(self.S, self.K, self.T, self.r, self.sigma)
-        d2 = self._d2(d1, self.sigma, self.T)
-        
-        # Calculate additional parameters for barrier options
-        lambda_ = (self.r - 0.5 * self.sigma**2) / self.sigma**2
-        y = np.log(barrier**2 / (self.S * self.K)) / (self.sigma * np.sqrt(self.T)) + lambda_ * self.sigma * np.sqrt(self.T)
-        x1 = np.log(self.S / barrier) / (self.sigma * np.sqrt(self.T)) + lambda_ * self.sigma * np.sqrt(self.T)
-        y1 = np.log(barrier / self.S) / (self.sigma * np.sqrt(self.T)) + lambda_ * self.sigma * np.sqrt(self.T)
-
-        # Price calculation based on option type and barrier type
-        if option_type == 'call':
-            if barrier_type == 'down-and-out':
-                if self.S <= barrier:
-                    return 0
-                return (self.S * norm.cdf(d1) - self.K * np.exp(-self.r * self.T) * norm.cdf(d2) - 
-                        self.S * (barrier / self.S)**(2 * lambda_) * (norm.cdf(-x1) - norm.cdf(-y)))
-            elif barrier_type == 'up-and-out':
-                if self.S >= barrier:
-                    return 0
-                return (self.S * norm.cdf(d1) - self.K * np.exp(-self.r * self.T) * norm.cdf(d2) - 
-                        self.S * (barrier / self.S)**(2 * lambda_) * (norm.cdf(y) - norm.cdf(x1)))
-            elif barrier_type == 'down-and-in':
-                if self.S <= barrier:
-                    return self.S * norm.cdf(d1) - self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
-                return self.S * (barrier / self.S)**(2 * lambda_) * norm.cdf(-x1)
-            elif barrier_type == 'up-and-in':
-                if self.S >= barrier:
-                    return self.S * norm.cdf(d1) - self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
-                return self.S * (barrier / self.S)**(2 * lambda_) * norm.cdf(y)
-        elif option_type == 'put':
-            if barrier_type == 'down-and-out':
-                if self.S <= barrier:
-                    return 0
-                return (self.K * np.exp(-self.r * self.T) * norm.cdf(-d2) - self.S * norm.cdf(-d1) + 
-                        self.S * (barrier / self.S)**(2 * lambda_) * (norm.cdf(-y) - norm.cdf(-x1)))
-            elif barrier_type == 'up-and-out':
-                if self.S >= barrier:
-                    return 0
-                return (self.K * np.exp(-self.r * self.T) * norm.cdf(-d2) - self.S * norm.cdf(-d1) + 
-                        self.S * (barrier / self.S)**(2 * lambda_) * (norm.cdf(x1) - norm.cdf(y)))
-            elif barrier_type == 'down-and-in':
-                if self.S <= barrier:
-                    return self.K * np.exp(-self.r * self.T) * norm.cdf(-d2) - self.S * norm.cdf(-d1)
-                return self.S * (barrier / self.S)**(2 * lambda_) * norm.cdf(-y)
-            elif barrier_type == 'up-and-in':
-                if self.S >= barrier:
-                    return self.K * np.exp(-self.r * self.T) * norm.cdf(-d2) - self.S * norm.cdf(-d1)
-                return self.S * (barrier / self.S)**(2 * lambda_) * norm.cdf(x1)
-        else:
-            raise ValueError(f"Invalid option type: {option_type}")
-
-    def calculate_greeks(self, option_type: Literal['call', 'put'], 
-                         barrier_type: Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out'], 
-                         barrier: float) -> Dict[str, float]:
-        """
-        Calculate the Greeks (Delta, Gamma, Vega, Theta, Rho) for a barrier option.
-
-        This method uses finite difference approximations to estimate the option Greeks.
-
-        Args:
-            option_type (Literal['call', 'put']): The type of option.
-            barrier_type (Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out']): The type of barrier.
-            barrier (float): The barrier price level.
-
-        Returns:
-            Dict[str, float]: A dictionary containing the calculated Greeks (Delta, Gamma, Vega, Theta, Rho).
-
-        Raises:
-            ValueError: If any of the required parameters are None.
-        """
-        if None in (self.S, self.K, self.T, self.r, self.sigma, barrier):
-            raise ValueError("All parameters must be non-None")
-        
-        eps = 1e-5
-        price = self.price_barrier_option(option_type, barrier_type, barrier)
-        
-        # Calculate Delta
-        S_up = self.S + eps
-        price_up = AdvancedDerivativesPricing(S_up, self.K, self.T, self.r, self.sigma).price_barrier_option(option_type, barrier_type, barrier)
-        delta = (price_up - price) / eps
-
-        # Calculate Gamma
-        S_down = self.S - eps
-        price_down = AdvancedDerivativesPricing(S_down, self.K, self.T, self.r, self.sigma).price_barrier_option(option_type, barrier_type, barrier)
-        gamma = (price_up - 2*price + price_down) / (eps**2)
-
-        # Calculate Vega
-        sigma_up = self.sigma + eps
-        price_sigma_up = AdvancedDerivativesPricing(self.S, self.K, self.T, self.r, sigma_up).price_barrier_option(option_type, barrier_type, barrier)
-        vega = (price_sigma_up - price) / eps
-
-        # Calculate Theta
-        T_down = max(self.T - eps/365, eps)  # Ensure T doesn't become negative
-        price_T_down = AdvancedDerivativesPricing(self.S, self.K, T_down, self.r, self.sigma).price_barrier_option(option_type, barrier_type, barrier)
-        theta = (price_T_down - price) / (eps/365)
-
-        # Calculate Rho
-        r_up = self.r + eps
-        price_r_up = AdvancedDerivativesPricing(self.S, self.K, self.T, r_up, self.sigma).price_barrier_option(option_type, barrier_type, barrier)
-        rho = (price_r_up - price) / eps
-
-        return {
-            'Delta': delta,
-            'Gamma': gamma,
-            'Vega': vega,
-            'Theta': theta,
-            'Rho': rho
-        }
-
-    def price_futures(self, storage_cost: float = 0, convenience_yield: float = 0) -> float:
-        """
-        Calculate the theoretical price of a futures contract.
-
-        This method uses the cost-of-carry model to price futures contracts.
-
-        Args:
-            storage_cost (float, optional): Annual storage cost as a fraction of the spot price. Defaults to 0.
-            convenience_yield (float, optional): Annual convenience yield as a fraction of the spot price. Defaults to 0.
-
-        Returns:
-            float: The calculated futures price.
-
-        Raises:
-            ValueError: If any of the required parameters are None.
-        """
-        if None in (self.S, self.T, self.r):
-            raise ValueError("S, T, and r must be non-None")
-        net_cost = storage_cost - convenience_yield
-        futures_price = self.S * np.exp((self.r + net_cost) * self.T)
-        return futures_price
-
-    def price_cfd(self, position: Literal['long', 'short'], financing_rate: float, holding_period: float) -> float:
-        """
-        Calculate the price (cost or profit) of a Contract for Difference (CFD).
-
-        This method calculates the theoretical price of a CFD based on the position,
-        financing rate, and holding period.
-
-        Args:
-            position (Literal['long', 'short']): The position taken in the CFD.
-            financing_rate (float): Daily financing rate as a fraction of the spot price.
-            holding_period (float): Number of days the CFD is held.
-
-        Returns:
-            float: The calculated CFD price (positive for profit, negative for loss).
-
-        Raises:
-            ValueError: If any of the required parameters are None or if an invalid position is provided.
-        """
-        if None in (self.S, self.r):
-            raise ValueError("S and r must be non-None")
-        daily_price_change = self.S * (np.exp(self.r * (holding_period / 365)) - 1)
-        financing_cost = self.S * financing_rate * holding_period / 365
-
-        if position == 'long':
-            return daily_price_change - financing_cost
-        elif position == 'short':
-            return -daily_price_change - financing_cost
-        else:
+import functools
+import math
+
+import numpy as np
+from numba import float64, int64, njit, vectorize
+from typing import Literal, Dict
+
+# Integer codes for the string flags, so the jitted kernel works on plain
+# scalars instead of Python strings
+_OPT_CODES = {'call': 0, 'put': 1}
+_BARRIER_CODES = {'up-and-in': 0, 'up-and-out': 1, 'down-and-in': 2, 'down-and-out': 3}
+
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+
+@njit(cache=True, fastmath=True)
+def _norm_cdf(x: float) -> float:
+    """
+    Standard normal CDF via math.erfc, usable inside jitted code.
+
+    The erfc form keeps full relative precision deep in the lower tail,
+    where 0.5*(1 + erf(...)) loses all significant digits to cancellation;
+    the barrier formula hits that regime whenever S is far from the barrier.
+    """
+    return 0.5 * math.erfc(-x * _INV_SQRT2)
+
+
+@njit(cache=True, fastmath=True)
+def _barrier_price_numba(S: float, K: float, T: float, r: float, sigma: float,
+                         barrier: float, opt_code: int, bar_code: int) -> float:
+    """
+    Compiled scalar core of the analytical barrier-option formula.
+
+    This is the numeric body of price_barrier_option extracted into a
+    module-level function that Numba can compile: pure float arithmetic,
+    no object attribute access, and the option/barrier types encoded as
+    integers (see _OPT_CODES / _BARRIER_CODES). cache=True persists the
+    compiled artefact so the multi-second JIT cost is paid once per
+    machine, not once per launch.
+    """
+    down_hit = S <= barrier
+    up_hit = S >= barrier
+
+    # Knocked-out options are worthless: exit before any transcendental work
+    if (bar_code == 3 and down_hit) or (bar_code == 1 and up_hit):
+        return 0.0
+
+    # Subexpressions shared by every remaining branch, computed once
+    sqrt_T = math.sqrt(T)
+    sig_sqrt_T = sigma * sqrt_T
+    inv_sig_sqrt_T = 1.0 / sig_sqrt_T
+
+    # The vanilla Black-Scholes leg is needed for knocked-in options (which
+    # degenerate to the plain option) and as the base of the out options;
+    # the in options away from the barrier only need the reflection term
+    knocked_in = (bar_code == 2 and down_hit) or (bar_code == 0 and up_hit)
+    vanilla = 0.0
+    if knocked_in or bar_code == 1 or bar_code == 3:
+        d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) * inv_sig_sqrt_T
+        d2 = d1 - sig_sqrt_T
+        disc = math.exp(-r * T)
+        if opt_code == 0:  # call
+            vanilla = S * _norm_cdf(d1) - K * disc * _norm_cdf(d2)
+        else:  # put
+            vanilla = K * disc * _norm_cdf(-d2) - S * _norm_cdf(-d1)
+        if knocked_in:
+            return vanilla
+
+    # Calculate the barrier-reflection parameters. log(barrier^2/(S*K))
+    # decomposes as log(barrier/S) + log(barrier/K), and the same
+    # log(barrier/S) gives x1 (negated) and the reflection power via exp,
+    # so the whole block costs two logs and one exp instead of two logs
+    # and a pow
+    lambda_ = (r - 0.5 * sigma**2) / sigma**2
+    lam_sig_sqrt_T = lambda_ * sig_sqrt_T
+    log_b_S = math.log(barrier / S)
+    y = (log_b_S + math.log(barrier / K)) * inv_sig_sqrt_T + lam_sig_sqrt_T
+    x1 = -log_b_S * inv_sig_sqrt_T + lam_sig_sqrt_T
+
+    power = math.exp(2.0 * lambda_ * log_b_S)
+
+    # Price calculation based on option type and barrier type
+    if opt_code == 0:  # call
+        if bar_code == 3:  # down-and-out
+            return vanilla - S * power * (_norm_cdf(-x1) - _norm_cdf(-y))
+        elif bar_code == 1:  # up-and-out
+            return vanilla - S * power * (_norm_cdf(y) - _norm_cdf(x1))
+        elif bar_code == 2:  # down-and-in
+            return S * power * _norm_cdf(-x1)
+        else:  # up-and-in
+            return S * power * _norm_cdf(y)
+    else:  # put
+        if bar_code == 3:  # down-and-out
+            return vanilla + S * power * (_norm_cdf(-y) - _norm_cdf(-x1))
+        elif bar_code == 1:  # up-and-out
+            return vanilla + S * power * (_norm_cdf(x1) - _norm_cdf(y))
+        elif bar_code == 2:  # down-and-in
+            return S * power * _norm_cdf(-y)
+        else:  # up-and-in
+            return S * power * _norm_cdf(x1)
+
+
+@vectorize([float64(float64, float64, float64, float64, float64, float64, int64, int64)],
+           target='parallel', fastmath=True)
+def _barrier_ufunc(S, K, T, r, sigma, barrier, opt_code, bar_code):
+    """
+    NumPy ufunc over the compiled barrier kernel.
+
+    Broadcasting, SIMD vectorisation and multithreading come from the
+    @vectorize machinery: pass an array for any subset of the parameters
+    (the payoff sweep passes S, the Greek grid bumps several) and the
+    scalar core runs across them in parallel. cache=True is not supported
+    for the parallel target, so this compiles once per process.
+    """
+    return _barrier_price_numba(S, K, T, r, sigma, barrier, opt_code, bar_code)
+
+
+@functools.lru_cache(maxsize=4096)
+def _price_barrier(S: float, K: float, T: float, r: float, sigma: float, barrier: float,
+                   option_type: str, barrier_type: str) -> float:
+    """
+    Memoised front end of the compiled barrier kernel.
+
+    Repeated queries with identical inputs — a re-plot of the same payoff
+    sweep, a second press of Calculate, or the unbumped base point of a
+    Greek evaluation — become O(1) dictionary lookups instead of kernel
+    calls. Floats hash by exact value, so only bit-identical inputs hit.
+    """
+    return _barrier_price_numba(S, K, T, r, sigma, barrier,
+                                _OPT_CODES[option_type], _BARRIER_CODES[barrier_type])
+
+
+class AdvancedDerivativesPricing:
+    """
+    A class for pricing various derivative instruments including barrier options, futures, and CFDs.
+
+    This class implements advanced pricing models for financial derivatives, with a focus on
+    barrier options. It also provides methods for calculating option Greeks, futures prices,
+    and CFD (Contract for Difference) prices.
+    """
+
+    def __init__(self, S: float, K: float, T: float, r: float, sigma: float):
+        """
+        Initialize the AdvancedDerivativesPricing object with market parameters.
+
+        Args:
+            S (float): Current price of the underlying asset.
+            K (float): Strike price of the option.
+            T (float): Time to maturity in years.
+            r (float): Risk-free interest rate (annualized).
+            sigma (float): Volatility of the underlying asset (annualized).
+
+        Raises:
+            ValueError: If any parameter is None or not a finite number.
+        """
+        # Validate once here, so the pricing methods don't re-check the same
+        # immutable attributes on every call
+        if any(v is None or not math.isfinite(v) for v in (S, K, T, r, sigma)):
+            raise ValueError("All parameters must be finite and non-None")
+        self.S = S
+        self.K = K
+        self.T = T
+        self.r = r
+        self.sigma = sigma
+
+    def _d1(self, S: float, K: float, T: float, r: float, sigma: float) -> float:
+        """
+        Calculate the d1 parameter used in the Black-Scholes formula.
+
+        Args:
+            S (float): Current price of the underlying asset.
+            K (float): Strike price of the option.
+            T (float): Time to maturity in years.
+            r (float): Risk-free interest rate (annualized).
+            sigma (float): Volatility of the underlying asset (annualized).
+
+        Returns:
+            float: The calculated d1 value.
+        """
+        return (math.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
+
+    def _d2(self, d1: float, sigma: float, T: float) -> float:
+        """
+        Calculate the d2 parameter used in the Black-Scholes formula.
+
+        Args:
+            d1 (float): The d1 parameter.
+            sigma (float): Volatility of the underlying asset (annualized).
+            T (float): Time to maturity in years.
+
+        Returns:
+            float: The calculated d2 value.
+        """
+        return d1 - sigma * math.sqrt(T)
+
+    def price_barrier_option(self, option_type: Literal['call', 'put'], 
+                             barrier_type: Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out'], 
+                             barrier: float) -> float:
+        """
+        Price a barrier option using the analytical formula.
+
+        This method implements the pricing model for various types of barrier options,
+        including up-and-in, up-and-out, down-and-in, and down-and-out for both call and put options.
+
+        Args:
+            option_type (Literal['call', 'put']): The type of option.
+            barrier_type (Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out']): The type of barrier.
+            barrier (float): The barrier price level.
+
+        Returns:
+            float: The calculated price of the barrier option.
+
+        Raises:
+            ValueError: If the barrier is None or an invalid option or barrier
+                type is provided.
+        """
+        if barrier is None:
+            raise ValueError("barrier must be non-None")
+
+        return self._price_static(self.S, self.K, self.T, self.r, self.sigma, barrier,
+                                  option_type, barrier_type)
+
+    @staticmethod
+    def _price_static(S: float, K: float, T: float, r: float, sigma: float, barrier: float,
+                      option_type: Literal['call', 'put'],
+                      barrier_type: Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out']) -> float:
+        """
+        Price a barrier option from explicit parameters, without an instance.
+
+        Stateless entry point for callers that would otherwise construct a
+        throwaway AdvancedDerivativesPricing object per evaluation; it
+        validates the type flags and dispatches to the memoised front end
+        of the compiled kernel. price_barrier_option delegates here.
+
+        Args:
+            S (float): Current price of the underlying asset.
+            K (float): Strike price of the option.
+            T (float): Time to maturity in years.
+            r (float): Risk-free interest rate (annualized).
+            sigma (float): Volatility of the underlying asset (annualized).
+            barrier (float): The barrier price level.
+            option_type (Literal['call', 'put']): The type of option.
+            barrier_type (Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out']): The type of barrier.
+
+        Returns:
+            float: The calculated price of the barrier option.
+
+        Raises:
+            ValueError: If an invalid option or barrier type is provided.
+        """
+        if option_type not in _OPT_CODES:
+            raise ValueError(f"Invalid option type: {option_type}")
+        if barrier_type not in _BARRIER_CODES:
+            raise ValueError(f"Invalid barrier type: {barrier_type}")
+        return _price_barrier(S, K, T, r, sigma, barrier, option_type, barrier_type)
+
+    @staticmethod
+    def price_barrier_option_vec(S_array, K: float, T: float, r: float, sigma: float,
+                                 option_type: Literal['call', 'put'],
+                                 barrier_type: Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out'],
+                                 barrier: float) -> np.ndarray:
+        """
+        Price a barrier option for an array of underlying prices in one pass.
+
+        This is the vectorised counterpart of price_barrier_option: the
+        call dispatches once to the compiled _barrier_ufunc, which runs
+        the scalar kernel across the whole sweep with SIMD vectorisation
+        and multithreading, so no per-price Python dispatch remains.
+        Parameters other than S_array may also be arrays, in which case
+        they broadcast under the usual ufunc rules.
+
+        Args:
+            S_array (np.ndarray): Prices of the underlying asset.
+            K (float): Strike price of the option.
+            T (float): Time to maturity in years.
+            r (float): Risk-free interest rate (annualized).
+            sigma (float): Volatility of the underlying asset (annualized).
+            option_type (Literal['call', 'put']): The type of option.
+            barrier_type (Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out']): The type of barrier.
+            barrier (float): The barrier price level.
+
+        Returns:
+            np.ndarray: The calculated barrier option prices, one per underlying price.
+
+        Raises:
+            ValueError: If an invalid option or barrier type is provided.
+        """
+        if option_type not in _OPT_CODES:
+            raise ValueError(f"Invalid option type: {option_type}")
+        if barrier_type not in _BARRIER_CODES:
+            raise ValueError(f"Invalid barrier type: {barrier_type}")
+        S = np.asarray(S_array, dtype=float)
+        opt_code = _OPT_CODES[option_type]
+        bar_code = _BARRIER_CODES[barrier_type]
+
+        # Out options price to exactly zero in the knocked-out region, so for
+        # a spot sweep only the active subset needs the kernel; the zeros are
+        # scattered back for free. The plot range typically straddles the
+        # barrier, which halves the kernel workload. Only applicable when the
+        # non-spot parameters are scalars, as in the payoff sweep.
+        if (barrier_type in ('down-and-out', 'up-and-out') and S.ndim > 0
+                and all(np.ndim(p) == 0 for p in (K, T, r, sigma, barrier))):
+            active = S > barrier if barrier_type == 'down-and-out' else S < barrier
+            prices = np.zeros_like(S)
+            if active.any():
+                prices[active] = _barrier_ufunc(S[active], K, T, r, sigma, barrier,
+                                                opt_code, bar_code)
+            return prices
+
+        return _barrier_ufunc(S, K, T, r, sigma, barrier, opt_code, bar_code)
+
+    def calculate_greeks(self, option_type: Literal['call', 'put'], 
+                         barrier_type: Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out'], 
+                         barrier: float) -> Dict[str, float]:
+        """
+        Calculate the Greeks (Delta, Gamma, Vega, Theta, Rho) for a barrier option.
+
+        This method uses central finite differences with parameter-scaled step
+        sizes, which keeps the differences well conditioned (a one-sided bump
+        of 1e-5 loses most of its significant digits to cancellation in the
+        Gamma numerator). All bumped evaluations are batched into a single
+        vectorised pricing call, so the Black-Scholes parameters and normal
+        CDF are evaluated in one array pass instead of several scalar passes.
+
+        Args:
+            option_type (Literal['call', 'put']): The type of option.
+            barrier_type (Literal['up-and-in', 'up-and-out', 'down-and-in', 'down-and-out']): The type of barrier.
+            barrier (float): The barrier price level.
+
+        Returns:
+            Dict[str, float]: A dictionary containing the calculated Greeks (Delta, Gamma, Vega, Theta, Rho).
+
+        Raises:
+            ValueError: If the barrier is None or an invalid option or barrier
+                type is provided.
+        """
+        if barrier is None:
+            raise ValueError("barrier must be non-None")
+
+        # Step sizes scaled to each parameter's magnitude: large enough that
+        # the second difference for Gamma stays well above rounding noise,
+        # small enough that the truncation error (O(h^2) for central
+        # differences) is negligible
+        h_S = 1e-4 * max(1.0, abs(self.S))
+        h_sigma = 1e-4 * max(1.0, abs(self.sigma))
+        h_T = min(1e-4 * max(1.0, self.T), 0.5 * self.T)  # Ensure T doesn't become negative
+        h_r = 1e-4
+
+        # Evaluate the base price and all eight bumped prices in one vectorised
+        # call: rows are (base, S up/down, sigma up/down, T down/up, r up/down)
+        S_arr = self.S + np.array([0.0, h_S, -h_S, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+        sigma_arr = self.sigma + np.array([0.0, 0.0, 0.0, h_sigma, -h_sigma, 0.0, 0.0, 0.0, 0.0])
+        T_arr = self.T + np.array([0.0, 0.0, 0.0, 0.0, 0.0, -h_T, h_T, 0.0, 0.0])
+        r_arr = self.r + np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, h_r, -h_r])
+
+        # Resolve the type codes once and hand the whole grid to the compiled
+        # ufunc in a single dispatch
+        if option_type not in _OPT_CODES:
+            raise ValueError(f"Invalid option type: {option_type}")
+        if barrier_type not in _BARRIER_CODES:
+            raise ValueError(f"Invalid barrier type: {barrier_type}")
+        prices = _barrier_ufunc(S_arr, self.K, T_arr, r_arr, sigma_arr, barrier,
+                                _OPT_CODES[option_type], _BARRIER_CODES[barrier_type])
+        (price, p_S_up, p_S_down, p_sigma_up, p_sigma_down,
+         p_T_down, p_T_up, p_r_up, p_r_down) = prices
+
+        # Form the central differences
+        delta = (p_S_up - p_S_down) / (2 * h_S)
+        gamma = (p_S_up - 2*price + p_S_down) / (h_S**2)
+        vega = (p_sigma_up - p_sigma_down) / (2 * h_sigma)
+        theta = (p_T_down - p_T_up) / (2 * h_T)
+        rho = (p_r_up - p_r_down) / (2 * h_r)
+
+        return {
+            'Delta': delta,
+            'Gamma': gamma,
+            'Vega': vega,
+            'Theta': theta,
+            'Rho': rho
+        }
+
+    def price_futures(self, storage_cost: float = 0, convenience_yield: float = 0) -> float:
+        """
+        Calculate the theoretical price of a futures contract.
+
+        This method uses the cost-of-carry model to price futures contracts.
+
+        Args:
+            storage_cost (float, optional): Annual storage cost as a fraction of the spot price. Defaults to 0.
+            convenience_yield (float, optional): Annual convenience yield as a fraction of the spot price. Defaults to 0.
+
+        Returns:
+            float: The calculated futures price.
+
+        """
+        net_cost = storage_cost - convenience_yield
+        futures_price = self.S * math.exp((self.r + net_cost) * self.T)
+        return futures_price
+
+    def price_cfd(self, position: Literal['long', 'short'], financing_rate: float, holding_period: float) -> float:
+        """
+        Calculate the price (cost or profit) of a Contract for Difference (CFD).
+
+        This method calculates the theoretical price of a CFD based on the position,
+        financing rate, and holding period.
+
+        Args:
+            position (Literal['long', 'short']): The position taken in the CFD.
+            financing_rate (float): Daily financing rate as a fraction of the spot price.
+            holding_period (float): Number of days the CFD is held.
+
+        Returns:
+            float: The calculated CFD price (positive for profit, negative for loss).
+
+        Raises:
+            ValueError: If an invalid position is provided.
+        """
+        daily_price_change = self.S * (math.exp(self.r * (holding_period / 365)) - 1)
+        financing_cost = self.S * financing_rate * holding_period / 365
+
+        if position == 'long':
+            return daily_price_change - financing_cost
+        elif position == 'short':
+            return -daily_price_change - financing_cost
+        else:
             raise ValueError("Invalid position type")
\ No newline at end of file
@@ -1,5 +1,6 @@
 from PyQt5.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QMessageBox
 from PyQt5.QtCore import QTimer
+import numpy as np
 from advanced_derivatives_pricing import AdvancedDerivativesPricing
 from parameter_input import ParameterInput
 from results_display import ResultsDisplay
@@ -43,6 +44,28 @@ class MainWindow(QMainWindow):
         # Connect the calculate button to the calculation method
         self.parameter_input.calculate_button.clicked.connect(self.calculate_and_update)
 
+        # Inputs of the last successful calculation, used to skip
+        # recomputation when Calculate is pressed with unchanged values
+        self._last_inputs = None
+
+        # Trigger Numba compilation once the event loop is running, so the
+        # first click on Calculate doesn't pay the JIT cost
+        QTimer.singleShot(0, self._warm_pricer)
+
+    def _warm_pricer(self):
+        """
+        Force compilation of the pricing kernels with a throwaway evaluation.
+
+        The scalar kernel is cached on disk, but the parallel ufunc cannot
+        be, so its first call in each process pays a multi-second JIT cost.
+        Running one representative scalar and batch price here moves that
+        cost to startup instead of the first press of Calculate.
+        """
+        pricer = AdvancedDerivativesPricing(100.0, 100.0, 1.0, 0.05, 0.2)
+        pricer.price_barrier_option('call', 'down-and-out', 90.0)
+        pricer.price_barrier_option_vec(np.array([100.0]), 100.0, 1.0, 0.05, 0.2,
+                                        'call', 'down-and-out', 90.0)
+
     def calculate_and_update(self):
         """
         Perform calculations based on user input and update the display.
@@ -74,6 +97,13 @@ class MainWindow(QMainWindow):
             barrier_type = self.parameter_input.barrier_type.currentText()
             cfd_position = self.parameter_input.cfd_position.currentText()
 
+            # Nothing changed since the last press: the displayed results and
+            # plot are still valid, so skip the whole recomputation
+            inputs = (S, K, T, r, sigma, barrier, storage_cost, convenience_yield,
+                      financing_rate, holding_period, option_type, barrier_type, cfd_position)
+            if inputs == self._last_inputs:
+                return
+
             # Perform pricing calculations
             pricer = AdvancedDerivativesPricing(S, K, T, r, sigma)
             price = pricer.price_barrier_option(option_type, barrier_type, barrier)
@@ -83,6 +113,7 @@ class MainWindow(QMainWindow):
 
             # Update results display
             self.results_display.update_results(price, greeks, futures_price, cfd_price)
+            self._last_inputs = inputs
             
             # Use QTimer to delay the plot update slightly, allowing the GUI to refresh
             QTimer.singleShot(100, lambda: self.plot_widget.plot_payoff(pricer, option_type, barrier_type, barrier))
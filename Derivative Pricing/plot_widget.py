@@ -20,12 +20,24 @@ class PlotWidget(QWidget):
         layout.addWidget(self.canvas)
         self.setLayout(layout)
 
+        # Create the artists once and update their data in place on each
+        # plot, instead of clearing and rebuilding the axes every time
+        self.price_line, = self.ax.plot([], [], label='Option Price')
+        self.strike_line = self.ax.axvline(x=0, color='r', linestyle='--', label='Strike Price')
+        self.barrier_line = self.ax.axvline(x=0, color='g', linestyle='--', label='Barrier')
+        self.ax.set_xlabel('Stock Price')
+        self.ax.set_ylabel('Option Price')
+        self.ax.legend()
+        self.ax.grid(True)
+
     def plot_payoff(self, pricer, option_type, barrier_type, barrier):
         """
         Plot the payoff of a barrier option.
 
         This method calculates and plots the option prices for a range of
         underlying asset prices, showing the payoff structure of the option.
+        The pricer is only read, never modified, so it can be reused by the
+        caller (e.g. for Greek recalculations) after plotting.
 
         Args:
             pricer (AdvancedDerivativesPricing): The pricing object.
@@ -33,25 +45,22 @@ class PlotWidget(QWidget):
             barrier_type (str): The type of barrier option.
             barrier (float): The barrier price.
         """
-        self.ax.clear()
         # Generate a range of stock prices centered around the strike price
-        stock_prices = np.linspace(pricer.K * 0.5, pricer.K * 1.5, 100)
-        option_prices = []
-        
-        # Calculate option prices for each stock price
-        for S in stock_prices:
-            pricer.S = S
-            option_prices.append(pricer.price_barrier_option(option_type, barrier_type, barrier))
-        
-        # Plot the option prices
-        self.ax.plot(stock_prices, option_prices, label='Option Price')
-        self.ax.axvline(x=pricer.K, color='r', linestyle='--', label='Strike Price')
-        self.ax.axvline(x=barrier, color='g', linestyle='--', label='Barrier')
-        self.ax.set_xlabel('Stock Price')
-        self.ax.set_ylabel('Option Price')
+        K = pricer.K
+        stock_prices = np.linspace(K * 0.5, K * 1.5, 100)
+
+        # Calculate option prices for all stock prices in a single vectorised call
+        option_prices = pricer.price_barrier_option_vec(
+            stock_prices, K, pricer.T, pricer.r, pricer.sigma,
+            option_type, barrier_type, barrier)
+
+        # Update the retained artists in place
+        self.price_line.set_data(stock_prices, option_prices)
+        self.strike_line.set_xdata([K, K])
+        self.barrier_line.set_xdata([barrier, barrier])
         self.ax.set_title(f'{option_type.capitalize()} {barrier_type} Barrier Option Payoff')
-        self.ax.legend()
-        self.ax.grid(True)
-        
+        self.ax.relim()
+        self.ax.autoscale_view()
+
         # Redraw the canvas
-        self.canvas.draw()
\ No newline at end of file
+        self.canvas.draw_idle()
\ No newline at end of file